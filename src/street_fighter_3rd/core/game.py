@@ -764,11 +764,10 @@ class Game:
 
         # Frame counter + combo state
         info = [f"frame {self.frame_count}  state {self.round_manager.game_state.name}"]
-        if hasattr(self.collision_system, 'get_combo_info'):
-            for pid, col in ((1, "P1"), (2, "P2")):
-                c = self.collision_system.get_combo_info(pid)
-                if c['active'] and c['count'] > 1:
-                    info.append(f"{col} combo {c['count']} hits / {c['damage']} dmg")
+        for pid, col in ((1, "P1"), (2, "P2")):
+            c = self.collision_system.get_combo_info(pid)
+            if c['active'] and c['count'] > 1:
+                info.append(f"{col} combo {c['count']} hits / {c['damage']} dmg")
         for i, line in enumerate(info):
             self.screen.blit(self.small_font.render(line, True, COLOR_WHITE),
                              (10, SCREEN_HEIGHT - 56 + i * 18))
@@ -935,8 +934,6 @@ class Game:
 
     def _render_combo_counters(self):
         """Per-player combo readout (hits + cumulative damage) when active."""
-        if not hasattr(self.collision_system, "get_combo_info"):
-            return
         center_x = SCREEN_WIDTH // 2
         for pid, anchor in ((1, center_x - 150), (2, center_x + 150)):
             c = self.collision_system.get_combo_info(pid)
@@ -1020,9 +1017,7 @@ class Game:
         big = self._fd_big_font.render(f"{fd.on_hit:+d}", True, adv_col)
         by = py + 50
         self.screen.blit(big, (px + 6, by))
-        combo = {}
-        if hasattr(self.collision_system, "get_combo_info"):
-            combo = self.collision_system.get_combo_info(latch["defender_id"]) or {}
+        combo = self.collision_system.get_combo_info(latch["defender_id"]) or {}
         stats = [
             ("Damage", combo.get("last_damage", 0)),
             ("Combo", combo.get("count", 0)),
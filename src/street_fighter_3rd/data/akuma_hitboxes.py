@@ -12,7 +12,9 @@ Provenance of the values surfaced here:
   - damage / stun / advantage: community (Baston ESN3S + tuning, NOT ROM-verified).
 
 The public API (dataclasses + the three ``get_*`` functions) is preserved
-verbatim because the collision adapter and the test-suite depend on it.
+because the collision adapter and the test-suite depend on it. Results are
+memoised and shared between callers, so they are immutable: the records are
+frozen and every sequence is a tuple.
 
 Position reference (unchanged):
   - X offset: positive = forward, negative = backward.
@@ -20,7 +22,8 @@ Position reference (unchanged):
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 from street_fighter_3rd.data.enums import HitType, CharacterState, HitEffect
 from street_fighter_3rd.data.hitbox_repository import HitboxRepository, MoveRecord, SourcedBox
@@ -41,7 +44,10 @@ _HIT_EFFECT_BY_NAME = {
 _CROUCH_STATES = {CharacterState.CROUCHING, CharacterState.CROUCH_HEAVY_KICK}
 
 
-@dataclass
+# The box records are read field-by-field every frame by the collision adapter
+# and never mutated by callers: frozen + slots gives slot access, no per-box
+# __dict__, and makes it safe to hand the same instance out more than once.
+@dataclass(frozen=True, slots=True)
 class HitboxFrame:
     """Defines a hitbox for a specific frame or frame range"""
     offset_x: int  # X offset from character center (+ = forward)
@@ -54,7 +60,7 @@ class HitboxFrame:
     hit_type: HitType = HitType.MID
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HurtboxFrame:
     """Defines character's hurtbox (vulnerable area)"""
     offset_x: int
@@ -63,18 +69,18 @@ class HurtboxFrame:
     height: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MoveFrameData:
     """Complete frame data for a move"""
     name: str
     state: CharacterState
     startup: int  # Frames before active
-    active: List[int]  # List of active frame numbers (1-indexed)
+    active: Tuple[int, ...]  # Active frame numbers (1-indexed)
     recovery: int  # Frames after active
     on_hit: int  # Frame advantage on hit
     on_block: int  # Frame advantage on block
-    hitboxes: List[Tuple[List[int], HitboxFrame]]  # (active_frames, hitbox)
-    hurtboxes: List[HurtboxFrame]  # Character's vulnerable areas
+    hitboxes: Tuple[Tuple[Tuple[int, ...], HitboxFrame], ...]  # (active_frames, hitbox)
+    hurtboxes: Tuple[HurtboxFrame, ...]  # Character's vulnerable areas
     hit_effect: HitEffect = HitEffect.NORMAL  # reaction this move causes on hit
 
 
@@ -119,9 +125,10 @@ def _build_move_frame_data(move: MoveRecord) -> MoveFrameData:
             box_to_frames.setdefault(key, []).append(frame_no)
             box_to_box.setdefault(key, box)
 
-    hitboxes: List[Tuple[List[int], HitboxFrame]] = []
-    for key, frames in box_to_frames.items():
-        hitboxes.append((frames, _hitbox_from_box(box_to_box[key], move)))
+    hitboxes = tuple(
+        (tuple(frames), _hitbox_from_box(box_to_box[key], move))
+        for key, frames in box_to_frames.items()
+    )
 
     combat = move.combat
     on_hit = combat.on_hit if combat else 0
@@ -130,13 +137,13 @@ def _build_move_frame_data(move: MoveRecord) -> MoveFrameData:
                                          HitEffect.NORMAL)
 
     state = getattr(CharacterState, move.state) if move.state else None
-    hurtboxes = _compose_hurtboxes(state) if state else []
+    hurtboxes = _compose_hurtboxes(state) if state else ()
 
     return MoveFrameData(
         name=move.state or move.rom_id,
         state=state,
         startup=int(move.timing.get("startup", 0)),
-        active=list(active),
+        active=tuple(active),
         recovery=int(move.timing.get("recovery", 0)),
         on_hit=int(on_hit),
         on_block=int(on_block),
@@ -146,7 +153,7 @@ def _build_move_frame_data(move: MoveRecord) -> MoveFrameData:
     )
 
 
-def _compose_hurtboxes(state: CharacterState, frame_number: int = 0) -> List[HurtboxFrame]:
+def _compose_hurtboxes(state: CharacterState, frame_number: int = 0) -> Tuple[HurtboxFrame, ...]:
     """Base (or crouch-scaled) hurtbox stack, plus per-move vulnerability
     extensions for the given 1-indexed active frame (if any)."""
     repo = _repo()
@@ -157,7 +164,7 @@ def _compose_hurtboxes(state: CharacterState, frame_number: int = 0) -> List[Hur
     # Layer the move's per-frame vulnerability boxes (extended limb) on top.
     if frame_number > 0:
         boxes = boxes + repo.get_vulnerability_boxes(state.name, frame_number)
-    return [
+    return tuple(
         HurtboxFrame(
             offset_x=int(round(b.offset_x)),
             offset_y=int(round(b.offset_y)),
@@ -165,24 +172,30 @@ def _compose_hurtboxes(state: CharacterState, frame_number: int = 0) -> List[Hur
             height=int(round(b.height)),
         )
         for b in boxes
-    ]
+    )
+
 
+# The repository is loaded once and never edited at runtime, so the shim's
+# output is a pure function of (state, frame). Each key is built on first use
+# and the same tuple is handed to every later caller -- no per-frame copies.
 
-def get_akuma_hitboxes(state: CharacterState, frame_number: int) -> List[HitboxFrame]:
+@lru_cache(maxsize=4096)
+def get_akuma_hitboxes(state: CharacterState, frame_number: int) -> Tuple[HitboxFrame, ...]:
     """Active attack hitboxes for Akuma's state on a given 1-indexed frame."""
     move = _repo().get_move_by_state(state.name)
     if not move:
-        return []
-    boxes = move.attack_boxes_for_frame(frame_number)
-    return [_hitbox_from_box(b, move) for b in boxes]
+        return ()
+    return tuple(_hitbox_from_box(b, move) for b in move.attack_boxes_for_frame(frame_number))
 
 
-def get_akuma_hurtboxes(state: CharacterState, frame_number: int = 0) -> List[HurtboxFrame]:
+@lru_cache(maxsize=4096)
+def get_akuma_hurtboxes(state: CharacterState, frame_number: int = 0) -> Tuple[HurtboxFrame, ...]:
     """Hurtboxes for Akuma's state: base stack + per-move vulnerability boxes for
     the given 1-indexed active frame (frame_number=0 -> base only)."""
     return _compose_hurtboxes(state, frame_number)
 
 
+@lru_cache(maxsize=256)
 def get_move_frame_data(state: CharacterState) -> MoveFrameData | None:
     """Complete frame data for a move, or None if the state is unmapped."""
     if state is None:
@@ -22,10 +22,10 @@ from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
 import logging
-import yaml
 from pydantic import BaseModel, Field, model_validator
 
 from street_fighter_3rd.data.character_dimensions import get_default_hurtbox_for_character
+from street_fighter_3rd.util import yaml_fast
 from street_fighter_3rd.util.logging_config import get_logger, log_once
 
 log = get_logger(__name__)
@@ -161,8 +161,7 @@ class HitboxRepository:
                      "(no fabricated boxes).", self._yaml_path)
             return
 
-        with open(self._yaml_path, "r") as f:
-            raw = yaml.safe_load(f) or {}
+        raw = yaml_fast.load(self._yaml_path) or {}
 
         self._meta = raw.get("meta", {})
         self._base_hurtbox = [SourcedBox(**b) for b in raw.get("base_hurtbox", [])]
@@ -25,6 +25,7 @@ from ..systems.sf3_core import (
     SF3Position, SF3HitData, SF3_DAMAGE_SCALING, SF3_PARRY_WINDOW
 )
 from ..systems.sf3_hitboxes import SF3HitboxType, SF3HitLevel
+from ..util import yaml_fast
 from ..util.logging_config import get_logger
 
 log = get_logger(__name__)
@@ -473,8 +474,7 @@ def load_character_data(file_path: Path) -> CharacterData:
     This provides a clean interface for loading character data with
     full Pydantic validation.
     """
-    with open(file_path, 'r') as f:
-        raw_data = yaml.safe_load(f)
+    raw_data = yaml_fast.load(file_path)
     
     return CharacterData(**raw_data)
 
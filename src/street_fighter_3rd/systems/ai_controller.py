@@ -162,8 +162,8 @@ class AIPlayerInput(PlayerInput):
         self.buttons_held = held
         self.current_direction = direction
         self.input_buffer.append(InputState(
-            direction, set(held), set(self.buttons_pressed_this_frame),
-            set(self.buttons_released_this_frame), self.frame_count))
+            direction, held, self.buttons_pressed_this_frame,
+            self.buttons_released_this_frame, self.frame_count))
 
     def reset(self):
         super().reset()
@@ -4,6 +4,7 @@ import os
 import yaml
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
+from street_fighter_3rd.util import yaml_fast
 from street_fighter_3rd.util.logging_config import get_logger
 from street_fighter_3rd.systems.animation import (
     Animation,
@@ -78,8 +79,7 @@ class AnimationLoader:
             raise AnimationLoadError(f"Animation config not found: {self.yaml_path}")
 
         try:
-            with open(self.yaml_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            self.config = yaml_fast.load(self.yaml_path)
         except yaml.YAMLError as e:
             raise AnimationLoadError(f"Failed to parse YAML: {e}")
 
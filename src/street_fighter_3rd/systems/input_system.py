@@ -193,6 +193,9 @@ class PlayerInput:
                             InputDirection.DOWN, InputDirection.DOWN_BACK, InputDirection.BACK],
                 button=Button.LIGHT_PUNCH, max_frames=28),
         ]
+        # Motions are looked up by name several times a frame (every special's
+        # check), so index them once instead of scanning the list each call.
+        self._motion_by_name = {m.name: m for m in self.motion_inputs}
 
     def connect_joystick(self, joystick_index: int) -> bool:
         """Connect a joystick to this player.
@@ -248,12 +251,13 @@ class PlayerInput:
 
         self.current_direction = direction_input
 
-        # Add to input buffer
+        # Add to input buffer. The three sets above are rebuilt every frame and
+        # never edited in place, so the buffered state can share them.
         input_state = InputState(
             direction=self.current_direction,
-            buttons_pressed=self.buttons_held.copy(),
-            buttons_just_pressed=self.buttons_pressed_this_frame.copy(),
-            buttons_just_released=self.buttons_released_this_frame.copy(),
+            buttons_pressed=self.buttons_held,
+            buttons_just_pressed=self.buttons_pressed_this_frame,
+            buttons_just_released=self.buttons_released_this_frame,
             frame_number=self.frame_count
         )
         self.input_buffer.append(input_state)
@@ -480,7 +484,7 @@ class PlayerInput:
             True if motion was completed
         """
         # Find the motion definition
-        motion = next((m for m in self.motion_inputs if m.name == motion_name), None)
+        motion = self._motion_by_name.get(motion_name)
         if not motion:
             return False
 
@@ -537,7 +541,7 @@ class PlayerInput:
         press instead of a single button. Consumes the motion on match."""
         if not self._multi_button_pressed(buttons):
             return False
-        motion = next((m for m in self.motion_inputs if m.name == motion_name), None)
+        motion = self._motion_by_name.get(motion_name)
         if not motion:
             return False
         start_frame = self._search_buffer_for_motion(motion.directions, motion.max_frames)
@@ -621,9 +625,10 @@ class PlayerInput:
         screen can't fire on round start.
         """
         self.input_buffer.clear()
-        self.buttons_held.clear()
-        self.buttons_pressed_this_frame.clear()
-        self.buttons_released_this_frame.clear()
+        # Rebind rather than clear(): buffered InputStates share these sets.
+        self.buttons_held = set()
+        self.buttons_pressed_this_frame = set()
+        self.buttons_released_this_frame = set()
         self.current_direction = InputDirection.NEUTRAL
         self.consumed_motion_frames.clear()
 
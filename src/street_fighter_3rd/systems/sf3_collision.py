@@ -22,6 +22,7 @@ import pygame
 
 from .sf3_core import SF3PlayerWork, SF3WorkStructure
 from .sf3_hitboxes import SF3HitboxManager, SF3HitboxType, SF3Hitbox
+from .spatial_hash import SpatialHashGrid, BROAD_PHASE_MIN_BOXES
 
 from street_fighter_3rd.util.logging_config import get_logger
 
@@ -87,6 +88,7 @@ class SF3HitStatus:
         self.stun = 0
         self.hitstun = 0
         self.blockstun = 0
+        self.pushback = 0.0
         self.hit_position_x = 0.0
         self.hit_position_y = 0.0
         self.frame_occurred = 0
@@ -137,6 +139,10 @@ class SF3CollisionSystem:
         
         # SF3's collision flags
         self.aiuchi_flag: bool = False  # Mutual hit flag
+
+        # Broad phase for crowded checks: one grid of hurtboxes per defender,
+        # updated incrementally from frame to frame (never reallocated).
+        self.broad_phase: Dict[int, SpatialHashGrid] = {}
     
     def hit_check_main_process(self):
         """
@@ -309,18 +315,61 @@ class SF3CollisionSystem:
         # 0 with no ids, and the adapter applied it to whoever it was called with --
         # so the second per-frame call mis-attributed the attacker's own hit back
         # onto the attacker. One hit + ids fixes that and supports trades.)
+        if len(attack_boxes) + len(targets) >= BROAD_PHASE_MIN_BOXES:
+            attack_box = self._first_connecting_box(
+                defender.work.player_number, attack_boxes, targets,
+                att_pos, attacker.work.face, def_pos, defender.work.face)
+            if attack_box is not None:
+                self._queue_hit(attacker, defender, attack_box, def_pos)
+            return
+
+        # Build each target rect once, then let pygame scan the whole list in C
+        # per attack box instead of a Python-level colliderect per pair.
+        def_face = defender.work.face
+        target_rects = [tb.get_rect(def_pos[0], def_pos[1], def_face) for tb in targets]
+        for attack_box in attack_boxes:
+            att_rect = attack_box.get_rect(att_pos[0], att_pos[1], attacker.work.face)
+            if att_rect.collidelist(target_rects) != -1:
+                self._queue_hit(attacker, defender, attack_box, def_pos)
+                return
+
+    def _first_connecting_box(self, defender_id: int,
+                              attack_boxes: List[SF3Hitbox], targets: List[SF3Hitbox],
+                              att_pos: Tuple[float, float], att_face: int,
+                              def_pos: Tuple[float, float], def_face: int) -> Optional[SF3Hitbox]:
+        """Broad-phase variant of the pairwise loop: first attack box (in order)
+        overlapping any target, or None. Same answer as the brute-force path.
+
+        The defender's grid is keyed by hurtbox slot, so a box that stays in the
+        same cells as last frame costs no bucket edits."""
+        if not targets:
+            return None
+        grid = self.broad_phase.get(defender_id)
+        if grid is None:
+            # Cells twice the largest target edge, so a box spans at most a
+            # 2x2 block of cells (SpatialHashGrid floors this at 32px).
+            cell_size = 2 * max(max(tb.width, tb.height) for tb in targets)
+            grid = self.broad_phase[defender_id] = SpatialHashGrid(cell_size)
+        for slot, tb in enumerate(targets):
+            grid.update(slot, tb, tb.get_rect(def_pos[0], def_pos[1], def_face))
+        for slot in grid.keys():
+            if slot >= len(targets):
+                grid.remove(slot)
+
         for attack_box in attack_boxes:
-            for tb in targets:
-                if attack_box.overlaps(tb, att_pos, attacker.work.face,
-                                       def_pos, defender.work.face):
-                    self._queue_hit(attacker, defender, attack_box, def_pos)
-                    return
+            att_rect = attack_box.get_rect(att_pos[0], att_pos[1], att_face)
+            candidates = [tb_rect for _tb, tb_rect in grid.query(att_rect)]
+            if att_rect.collidelist(candidates) != -1:
+                return attack_box
+        return None
 
     def _queue_hit(self, attacker, defender, attack_box, hit_position):
         """Append one confirmed hit to the queue with its attacker/defender ids."""
         if self.hit_queue_input >= len(self.hit_status):
             return
-        hit = SF3HitStatus()
+        # Fill the preallocated slot in place (HS hs[32] is never reallocated).
+        hit = self.hit_status[self.hit_queue_input]
+        hit.clear()
         hit.attacker_id = attacker.work.player_number
         hit.defender_id = defender.work.player_number
         hit.damage = attack_box.damage
@@ -330,7 +379,6 @@ class SF3CollisionSystem:
         hit.result_flags = SF3CollisionResult.HIT_CONFIRMED
         hit.hit_position_x, hit.hit_position_y = hit_position
         hit.frame_occurred = self.current_frame
-        self.hit_status[self.hit_queue_input] = hit
         self.hit_queue_input += 1
     
     def _direct_apply_damage(self, attack_box: SF3Hitbox, hit_position: Tuple[float, float]):
@@ -345,8 +393,9 @@ class SF3CollisionSystem:
         - Multi-hit detection
         - Advanced collision resolution
         """
-        # Create a simple hit status
-        hit = SF3HitStatus()
+        # Overwrite the first slot in place
+        hit = self.hit_status[0]
+        hit.clear()
         hit.damage = attack_box.damage
         hit.hitstun = attack_box.hitstun
         hit.blockstun = attack_box.blockstun
@@ -355,8 +404,6 @@ class SF3CollisionSystem:
         hit.hit_position_y = hit_position[1]
         hit.frame_occurred = self.current_frame
 
-        # Store in first available slot
-        self.hit_status[0] = hit
         self.hit_queue_input = 1
 
     def _check_throw_attempts(self, player1: SF3PlayerWork, player2: SF3PlayerWork,
@@ -98,7 +98,9 @@ class SF3CollisionAdapter:
     This allows us to use authentic SF3 collision mechanics while keeping our
     existing Character class interface.
     """
-    
+
+    _instance: Optional["SF3CollisionAdapter"] = None
+
     def __init__(self):
         self.sf3_system = SF3CollisionSystem()
         self.sf3_parry_system = SF3ParrySystem()
@@ -123,6 +125,17 @@ class SF3CollisionAdapter:
         # Results from last collision check
         self.last_results: List[CollisionResult] = []
 
+    @classmethod
+    def instance(cls) -> "SF3CollisionAdapter":
+        """Shared adapter for callers that don't own a Game (tests, tools).
+
+        Call reset() before reuse. A Game builds its own adapter so two live
+        games never share a hit queue or combo state.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def tick(self, *characters):
         """Advance the SF3 core by exactly one game frame.
 
@@ -813,10 +826,13 @@ class SF3CollisionAdapter:
         self.sf3_combo_system.reset_all_combos()
 
     def reset(self):
-        """Reset all per-round state: frame counter, hit queue, combos, parry."""
+        """Reset all per-round state: frame counter, hit queue, combos, parry,
+        and broad-phase grids. Hitbox data is not reloaded."""
         self.frame_counter = 0
         self.sf3_system.update_frame(0)
         self.sf3_system.clear_hit_queue()
+        for grid in self.sf3_system.broad_phase.values():
+            grid.clear()
         self.sf3_combo_system.reset_all_combos()
         for work in self.player_works.values():
             self.sf3_parry_system.reset_parry_state(work)
@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from street_fighter_3rd.util.logging_config import get_logger
+from .sf3_core import SF3_DAMAGE_SCALING, scaled_damage
 
 log = get_logger(__name__)
 
@@ -77,20 +78,10 @@ class SF3ComboSystem:
     based on authentic SF3 behavior.
     """
     
-    # SF3 authentic damage scaling values
-    # Each successive hit does less damage
-    DAMAGE_SCALING_TABLE = [
-        1.00,  # 1st hit - 100%
-        0.90,  # 2nd hit - 90%
-        0.80,  # 3rd hit - 80%
-        0.70,  # 4th hit - 70%
-        0.60,  # 5th hit - 60%
-        0.50,  # 6th hit - 50%
-        0.40,  # 7th hit - 40%
-        0.30,  # 8th hit - 30%
-        0.20,  # 9th hit - 20%
-        0.10,  # 10th+ hit - 10%
-    ]
+    # SF3 authentic damage scaling values as multipliers (1st hit 100% down to
+    # 10% for the 10th+ hit). Display/next-hit queries read this; damage itself
+    # is computed by sf3_core.scaled_damage from the integer percent table.
+    DAMAGE_SCALING_TABLE = [pct / 100 for pct in SF3_DAMAGE_SCALING]
 
     def __init__(self):
         # Combo state for each player (who is being comboed)
@@ -132,27 +123,27 @@ class SF3ComboSystem:
             self._start_new_combo(combo_state, current_time)
         
         # Apply damage scaling
-        scaled_damage = self._apply_damage_scaling(base_damage, combo_state.combo_count)
+        damage = self._apply_damage_scaling(base_damage, combo_state.combo_count)
         
         # Record the hit
         hit = SF3ComboHit(
             damage=base_damage,
-            scaled_damage=scaled_damage,
+            scaled_damage=damage,
             hit_number=combo_state.combo_count,
             timestamp=current_time,
             hit_type=hit_type
         )
         combo_state.combo_hits.append(hit)
-        combo_state.combo_damage += scaled_damage
+        combo_state.combo_damage += damage
         combo_state.last_hit_time = current_time
         combo_state.combo_active = True
         
         # Update scaling for next hit
         self._update_scaling_factors(combo_state)
         
-        log.debug("Combo Hit #%s: %s -> %s damage", combo_state.combo_count, base_damage, scaled_damage)
+        log.debug("Combo Hit #%s: %s -> %s damage", combo_state.combo_count, base_damage, damage)
 
-        return scaled_damage
+        return damage
 
     def _start_new_combo(self, combo_state: SF3ComboState, current_time: float):
         """Start a new combo"""
@@ -166,15 +157,9 @@ class SF3ComboSystem:
         if hit_number <= 0:
             return base_damage
         
-        # Get scaling factor (hit_number is 1-indexed)
-        scaling_index = min(hit_number - 1, len(self.DAMAGE_SCALING_TABLE) - 1)
-        scaling_factor = self.DAMAGE_SCALING_TABLE[scaling_index]
-        
-        # Apply scaling
-        scaled_damage = int(base_damage * scaling_factor)
-        
+        # hit_number is 1-indexed; scaled_damage counts the hits before this one.
         # Minimum damage is 1
-        return max(1, scaled_damage)
+        return max(1, scaled_damage(base_damage, hit_number - 1))
     
     def _update_scaling_factors(self, combo_state: SF3ComboState):
         """Update scaling factors for next hit"""
@@ -146,7 +146,8 @@ class SF3WorkStructure:
     
     def store_old_routine(self):
         """Store current routine state for rollback (like SF3's old_rno)"""
-        self.old_routine_no = self.routine_no.copy()
+        # Copy into the existing 8-slot list; no new list per state change.
+        self.old_routine_no[:] = self.routine_no
     
     def set_routine_state(self, phase: SF3GamePhase, category: SF3StateCategory, specific: int = 0):
         """
@@ -238,10 +239,7 @@ class SF3PlayerWork:
         """
         if combo_scaling and self.combo_count > 0:
             # SF3's authentic damage scaling
-            scaling_values = [100, 90, 80, 70, 60, 50, 40, 30, 20, 10]
-            scale_index = min(self.combo_count, len(scaling_values) - 1)
-            scale = scaling_values[scale_index]
-            actual_damage = int(damage * scale / 100)
+            actual_damage = scaled_damage(damage, self.combo_count)
         else:
             actual_damage = damage
         
@@ -268,6 +266,10 @@ class SF3PlayerWork:
 # SF3's authentic damage scaling array
 SF3_DAMAGE_SCALING = [100, 90, 80, 70, 60, 50, 40, 30, 20, 10]
 
+# Read-only copy for the per-hit lookup (the public list above is mutable).
+_SCALING_TABLE = tuple(SF3_DAMAGE_SCALING)
+_LAST_SCALING_INDEX = len(_SCALING_TABLE) - 1
+
 # SF3's parry window (frames)
 SF3_PARRY_WINDOW = 7
 
@@ -278,6 +280,16 @@ SF3_HIT_QUEUE_SIZE = 32
 SF3_GUARD_DIRECTIONS = ["high", "mid", "low"]
 
 
+def scaled_damage(base_damage: int, combo_count: int) -> int:
+    """
+    Damage of a hit landing with ``combo_count`` prior hits in the combo
+
+    Index 0 is the unscaled first hit; past the end of the table the last
+    (10%) entry applies. Integer math, truncating like the original formula.
+    """
+    return base_damage * _SCALING_TABLE[min(combo_count, _LAST_SCALING_INDEX)] // 100
+
+
 def create_sf3_player(player_number: int, team: int = None) -> SF3PlayerWork:
     """
     Create a new SF3 player with proper initialization
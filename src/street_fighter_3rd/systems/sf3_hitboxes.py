@@ -40,7 +40,7 @@ class SF3HitLevel(Enum):
     UNBLOCKABLE = "unblockable"  # Cannot be blocked
 
 
-@dataclass
+@dataclass(slots=True)
 class SF3Hitbox:
     """
     Individual hitbox in SF3 system
@@ -140,13 +140,44 @@ class SF3Hitbox:
 
         This is the core collision detection that SF3 uses.
         """
-        my_rect = self.get_rect(my_pos[0], my_pos[1], my_facing)
-        other_rect = other.get_rect(other_pos[0], other_pos[1], other_facing)
+        if self.width < 1 or self.height < 1 or other.width < 1 or other.height < 1:
+            # Empty/negative boxes: keep pygame's rules for degenerate rects.
+            my_rect = self.get_rect(my_pos[0], my_pos[1], my_facing)
+            other_rect = other.get_rect(other_pos[0], other_pos[1], other_facing)
+            return my_rect.colliderect(other_rect)
+
+        # Same test as get_rect(...).colliderect(...) on the integer edges,
+        # without allocating two Rects per box pair.
+        l1, t1, r1, b1 = self._edges(my_pos[0], my_pos[1], my_facing)
+        l2, t2, r2, b2 = other._edges(other_pos[0], other_pos[1], other_facing)
+        return l1 < r2 and l2 < r1 and t1 < b2 and t2 < b1
+
+    def _edges(self, character_x: float, character_y: float,
+               facing: int) -> Tuple[int, int, int, int]:
+        """(left, top, right, bottom) of ``get_rect``, truncated to ints as Rect does."""
+        if self.anchor == "center":
+            left = character_x + (self.offset_x * facing) - self.width / 2
+        elif facing >= 0:
+            left = character_x + self.offset_x
+        else:
+            left = character_x - self.offset_x - self.width
+        left = int(left)
+        top = int(character_y + self.offset_y)
+        return left, top, left + int(self.width), top + int(self.height)
 
-        return my_rect.colliderect(other_rect)
 
+# Frame attribute holding each type's box list. Built once so per-frame lookups
+# in the collision loop don't rebuild a type -> list dict on every call.
+_BOX_LIST_ATTR: Dict[SF3HitboxType, str] = {
+    SF3HitboxType.ATTACK: "attack_boxes",
+    SF3HitboxType.BODY: "body_boxes",
+    SF3HitboxType.HAND: "hand_boxes",
+    SF3HitboxType.GRAB: "grab_boxes",
+    SF3HitboxType.PROJECTILE: "projectile_boxes",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class SF3HitboxFrame:
     """
     All hitboxes for a single animation frame
@@ -165,14 +196,8 @@ class SF3HitboxFrame:
     
     def get_hitboxes_by_type(self, hitbox_type: SF3HitboxType) -> List[SF3Hitbox]:
         """Get all hitboxes of a specific type for this frame"""
-        type_map = {
-            SF3HitboxType.ATTACK: self.attack_boxes,
-            SF3HitboxType.BODY: self.body_boxes,
-            SF3HitboxType.HAND: self.hand_boxes,
-            SF3HitboxType.GRAB: self.grab_boxes,
-            SF3HitboxType.PROJECTILE: self.projectile_boxes,
-        }
-        return type_map.get(hitbox_type, [])
+        attr = _BOX_LIST_ATTR.get(hitbox_type)
+        return getattr(self, attr) if attr is not None else []
     
     def has_active_hitboxes(self, hitbox_type: SF3HitboxType) -> bool:
         """Check if this frame has any active hitboxes of the given type"""
@@ -181,16 +206,9 @@ class SF3HitboxFrame:
     
     def add_hitbox(self, hitbox_type: SF3HitboxType, hitbox: SF3Hitbox):
         """Add a hitbox to this frame"""
-        if hitbox_type == SF3HitboxType.ATTACK:
-            self.attack_boxes.append(hitbox)
-        elif hitbox_type == SF3HitboxType.BODY:
-            self.body_boxes.append(hitbox)
-        elif hitbox_type == SF3HitboxType.HAND:
-            self.hand_boxes.append(hitbox)
-        elif hitbox_type == SF3HitboxType.GRAB:
-            self.grab_boxes.append(hitbox)
-        elif hitbox_type == SF3HitboxType.PROJECTILE:
-            self.projectile_boxes.append(hitbox)
+        attr = _BOX_LIST_ATTR.get(hitbox_type)
+        if attr is not None:
+            getattr(self, attr).append(hitbox)
 
 
 @dataclass
@@ -0,0 +1,129 @@
+"""
+Uniform-grid spatial hash for collision broad phase.
+
+Boxes are bucketed by the grid cells their AABB covers; a query returns only
+the items sharing a cell with the query rect, so the precise rect test runs on
+neighbours instead of every (hitbox, hurtbox) pair. The grid is meant to be
+owned by a long-lived system -- buckets stay allocated across frames.
+
+Two ways to fill it:
+  - ``clear()`` + ``insert()`` rebuilds from scratch.
+  - ``update(key, ...)`` keeps a keyed entry and only touches buckets when its
+    box crosses a cell boundary. A box that stays inside the same cells costs
+    one cell computation and no bucket edits, which is the common case for
+    mostly-stationary fighters.
+
+At fighting-game box counts brute force is cheaper than hashing, so callers
+only switch to the grid above ``BROAD_PHASE_MIN_BOXES`` (see sf3_collision).
+"""
+
+from typing import Any, Dict, FrozenSet, Hashable, List, Tuple
+
+import pygame
+
+# Below this many boxes per check, a pairwise loop beats building the grid.
+BROAD_PHASE_MIN_BOXES = 32
+
+# Smallest cell edge; tiny cells make every box span many buckets.
+MIN_CELL_SIZE = 32
+
+Cell = Tuple[int, int]
+
+
+class SpatialHashGrid:
+    """Spatial hash of (item, rect) pairs over square cells.
+
+    Size cells at about twice the largest box edge (sf3_collision sizes each
+    defender's grid from its hurtboxes); 128 is only the default for callers
+    that don't know their boxes up front.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = max(MIN_CELL_SIZE, int(cell_size))
+        # Each entry is a mutable [item, rect] shared by every bucket it is in,
+        # so a keyed update that stays in the same cells refreshes it in place.
+        self._cells: Dict[Cell, List[list]] = {}
+        self._keyed: Dict[Hashable, Tuple[FrozenSet[Cell], list]] = {}
+
+    def cells_for(self, rect: pygame.Rect) -> List[Cell]:
+        """Grid cells overlapped by ``rect`` (right/bottom edges exclusive)."""
+        size = self.cell_size
+        x0, y0 = rect.left // size, rect.top // size
+        x1 = (rect.right - 1) // size if rect.width > 0 else x0
+        y1 = (rect.bottom - 1) // size if rect.height > 0 else y0
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def clear(self):
+        """Empty every bucket (and forget keyed entries) without releasing buckets."""
+        for bucket in self._cells.values():
+            bucket.clear()
+        self._keyed.clear()
+
+    def _add(self, entry: list, cells):
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                bucket = self._cells[cell] = []
+            bucket.append(entry)
+
+    def _discard(self, entry: list, cells):
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket:
+                for i, other in enumerate(bucket):
+                    if other is entry:
+                        del bucket[i]
+                        break
+
+    def insert(self, item: Any, rect: pygame.Rect):
+        """Add an unkeyed ``item`` to every cell ``rect`` covers."""
+        self._add([item, rect], self.cells_for(rect))
+
+    def update(self, key: Hashable, item: Any, rect: pygame.Rect):
+        """Insert or move the entry for ``key``.
+
+        If the new rect covers the same cells as last time, only the stored
+        item/rect are refreshed; otherwise the entry leaves the cells it no
+        longer covers and joins the new ones.
+        """
+        cells = frozenset(self.cells_for(rect))
+        previous = self._keyed.get(key)
+        if previous is None:
+            entry = [item, rect]
+            self._add(entry, cells)
+            self._keyed[key] = (cells, entry)
+            return
+
+        old_cells, entry = previous
+        entry[0], entry[1] = item, rect
+        if cells == old_cells:
+            return
+        self._discard(entry, old_cells - cells)
+        self._add(entry, cells - old_cells)
+        self._keyed[key] = (cells, entry)
+
+    def remove(self, key: Hashable):
+        """Drop the entry for ``key`` (no-op if absent)."""
+        previous = self._keyed.pop(key, None)
+        if previous is not None:
+            cells, entry = previous
+            self._discard(entry, cells)
+
+    def keys(self) -> List[Hashable]:
+        """Keys of the entries added through ``update``."""
+        return list(self._keyed)
+
+    def query(self, rect: pygame.Rect) -> List[Tuple[Any, pygame.Rect]]:
+        """(item, rect) pairs sharing a cell with ``rect``, each listed once.
+
+        This is a broad-phase result: callers still run the exact rect test.
+        """
+        found: List[Tuple[Any, pygame.Rect]] = []
+        seen = set()
+        for cell in self.cells_for(rect):
+            for entry in self._cells.get(cell, ()):
+                marker = id(entry)
+                if marker not in seen:
+                    seen.add(marker)
+                    found.append((entry[0], entry[1]))
+        return found
@@ -0,0 +1,23 @@
+"""YAML loading through libyaml when PyYAML was built with it.
+
+``yaml.safe_load`` always uses the pure-Python parser. ``CSafeLoader`` accepts
+the same safe subset and is several times faster; PyYAML wheels ship it, but a
+source build without libyaml does not, so fall back to ``SafeLoader`` then.
+
+Files are opened in binary mode: the loader detects the encoding itself, which
+skips a text-decoding layer on the way in.
+"""
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+import yaml
+
+
+def load(path):
+    """Parse the YAML file at ``path`` (a path or an importlib Traversable)."""
+    opener = getattr(path, "open", None)
+    with (opener("rb") if opener is not None else open(path, "rb")) as f:
+        return yaml.load(f, Loader=YamlLoader)
@@ -1,15 +1,83 @@
 """Pytest configuration and fixtures."""
+import os
 import sys
 from pathlib import Path
 
-# Add src to Python path for imports
-src_path = Path(__file__).parent.parent / "src"
+# Add src to Python path for imports, and the repo root for tools.diagnostics
+# (the scenario harness many tests drive the game through).
+repo_root = Path(__file__).parent.parent
+src_path = repo_root / "src"
+sys.path.insert(0, str(repo_root))
 sys.path.insert(0, str(src_path))
 
+# Headless SDL for every test module (CI sets these too): display and audio
+# init happen in memory, with no window or sound device handshake.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
 import pytest
 
+from street_fighter_3rd.characters.akuma import Akuma
+from street_fighter_3rd.data.constants import STAGE_FLOOR
+from street_fighter_3rd.systems.sf3_collision_adapter import SF3CollisionAdapter
+from street_fighter_3rd.systems.vfx import VFXManager
+
+
 @pytest.fixture
 def mock_pygame():
     """Mock pygame for headless testing."""
     # Add pygame mocking if needed for CI/CD
     pass
+
+
+# -- shared SF3 objects --------------------------------------------------------
+# The collision adapter (SF3CollisionAdapter.instance()) and VFX manager (spark
+# preloading) are built once and handed to tests freshly reset. Characters carry
+# per-test state and stay function-scoped.
+
+@pytest.fixture
+def collision_adapter():
+    """The shared SF3CollisionAdapter, reset to a fresh round."""
+    adapter = SF3CollisionAdapter.instance()
+    adapter.reset()
+    return adapter
+
+
+@pytest.fixture(scope="module")
+def _module_vfx_manager():
+    # Module scope: sparks are converted against the module's display, which
+    # the per-module pygame fixtures tear down at module end.
+    return VFXManager()
+
+
+@pytest.fixture
+def vfx_manager(_module_vfx_manager):
+    """A VFXManager with no live effects or pending shake."""
+    _module_vfx_manager.clear()
+    return _module_vfx_manager
+
+
+@pytest.fixture
+def akuma_p1():
+    """Player 1 Akuma standing on the stage floor."""
+    return Akuma(200, STAGE_FLOOR, player_number=1)
+
+
+@pytest.fixture
+def akuma_p2():
+    """Player 2 Akuma standing 50px in front of ``akuma_p1`` (in LP range)."""
+    return Akuma(250, STAGE_FLOOR, player_number=2)
+
+
+@pytest.fixture
+def pygame_screen():
+    """An 800x600 display surface.
+
+    Only the subsystems Game needs (display, font) are brought up; a bare
+    pygame.init() would also start the mixer and probe audio devices.
+    Re-initialising an already-up subsystem is a no-op.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    return pygame.display.set_mode((800, 600))
@@ -5,13 +5,11 @@ gating, and super usage. Determinism (no RNG) must hold per tier.
 """
 
 import os
-import sys
 from types import SimpleNamespace as NS
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from street_fighter_3rd.core.game import Game
 from street_fighter_3rd.core.game_modes import GameModeManager, GameMode
 from street_fighter_3rd.systems.ai_controller import AIController, AIPlayerInput
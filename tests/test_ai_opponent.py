@@ -5,13 +5,11 @@ machine) and must stay deterministic (the engine has no RNG).
 """
 
 import os
-import sys
 from types import SimpleNamespace as NS
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from street_fighter_3rd.systems.ai_controller import AIController
 from street_fighter_3rd.data.enums import InputDirection, Button
 
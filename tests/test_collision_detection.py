@@ -11,32 +11,31 @@ Collision detection tests for the live SF3 collision path:
 import pygame
 import pytest
 
+from street_fighter_3rd.core.game import Game
 from street_fighter_3rd.systems.sf3_collision_adapter import SF3CollisionAdapter
 from street_fighter_3rd.systems.sf3_combo_system import SF3ComboSystem
-from street_fighter_3rd.systems.vfx import VFXManager
-from street_fighter_3rd.characters.akuma import Akuma
 from street_fighter_3rd.data.enums import CharacterState
-from street_fighter_3rd.data.constants import STAGE_FLOOR
 
 
 @pytest.fixture(scope="module", autouse=True)
 def pygame_headless():
-    pygame.init()
+    pygame.display.init()
+    pygame.font.init()
     pygame.display.set_mode((1, 1))
     yield
-    pygame.quit()
+    pygame.font.quit()
+    pygame.display.quit()
 
 
-def test_yaml_hitbox_loading():
+def test_yaml_hitbox_loading(akuma_p1, collision_adapter):
     """Frame-data hitboxes load for an attack on its active frames."""
-    character = Akuma(200, STAGE_FLOOR, player_number=1)
+    character = akuma_p1
     character._transition_to_state(CharacterState.LIGHT_PUNCH)
     # Standing LP is active on frames 5-7 (1-indexed); the adapter reads
     # state_frame + 1, so state_frame=4 puts us on active frame 5.
     character.state_frame = 4
 
-    adapter = SF3CollisionAdapter()
-    hitboxes = adapter._get_character_hitboxes(character)
+    hitboxes = collision_adapter._get_character_hitboxes(character)
 
     assert hitboxes, "Standing LP must have an active hitbox on frame 5"
     hitbox_data, rect = hitboxes[0]
@@ -48,10 +47,10 @@ def test_yaml_hitbox_loading():
     assert rect.width == hitbox_data.width and rect.height == hitbox_data.height
 
 
-def test_collision_detection():
+def test_collision_detection(akuma_p1, akuma_p2, collision_adapter, vfx_manager):
     """A light punch on its active frame must hit a nearby defender."""
-    attacker = Akuma(200, STAGE_FLOOR, player_number=1)
-    defender = Akuma(250, STAGE_FLOOR, player_number=2)  # Close enough to hit
+    attacker = akuma_p1
+    defender = akuma_p2  # 50px away: close enough to hit
 
     # Standing MP/LK rom pointers are unidentified (framedata_meta.lua disproved
     # the old guesses), so use LP (rom 1438), which is authoritatively named.
@@ -59,9 +58,7 @@ def test_collision_detection():
     # Standing LP is active on frame 5 (1-indexed); adapter reads state_frame + 1.
     attacker.state_frame = 4
 
-    adapter = SF3CollisionAdapter()
-    vfx_manager = VFXManager()
-
+    adapter = collision_adapter
     initial_health = defender.health
 
     adapter.tick()  # advance the SF3 core one game frame
@@ -96,14 +93,11 @@ def test_combo_scaling():
     assert damages == expected, f"scaling sequence wrong: got {damages}, expected {expected}"
 
 
-def test_game_integration():
+def test_game_integration(pygame_screen):
     """The game uses SF3CollisionAdapter and survives a fixed-timestep update."""
-    from street_fighter_3rd.core.game import Game
-
-    screen = pygame.display.set_mode((800, 600))
-    game = Game(screen)
+    game = Game(pygame_screen)
 
-    assert hasattr(game.collision_system, 'sf3_combo_system'), (
+    assert isinstance(game.collision_system, SF3CollisionAdapter), (
         "Game must use SF3CollisionAdapter as its collision system"
     )
 
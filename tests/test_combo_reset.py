@@ -8,12 +8,10 @@ test_sf3_complete_integration.
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.harness import new_game
 from tools.diagnostics.scenario import ScriptedInputSystem, mash_jabs
 from street_fighter_3rd.data.enums import FacingDirection
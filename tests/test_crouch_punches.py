@@ -5,12 +5,10 @@ COMBAT_MAP, so they loaded no attack box and dealt 0 damage.
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.scenario import run_scenario, crouch_hp
 from street_fighter_3rd.data.akuma_hitboxes import get_move_frame_data
 from street_fighter_3rd.data.enums import CharacterState
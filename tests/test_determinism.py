@@ -3,12 +3,10 @@ the same scripted inputs from the same setup produce an identical state timeline
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.scenario import run_scenario, jump_arc, jab_knockback
 
 
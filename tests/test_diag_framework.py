@@ -1,12 +1,10 @@
 """Smoke tests for the new diagnostics framework (replay/montage + scenarios)."""
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.scenario import run_scenario, jump_arc, jab_knockback
 from tools.diagnostics.harness import render_recorded_clip, build_montage
 from tools.diagnostics.compare import compare_timelines
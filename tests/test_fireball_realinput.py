@@ -8,12 +8,10 @@ motion-buffer -> special-move path the player actually uses.
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.harness import new_game
 
 # Player-1 key map (input_system.py): K_s=down, K_d=right(=forward facing right),
@@ -5,12 +5,10 @@ and sat in a corner. Now it captures the last move and keeps showing for ~2s.
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.harness import new_game
 from tools.diagnostics.scenario import ScriptedInputSystem, hold, tap
 from street_fighter_3rd.data.enums import Button, InputDirection, FacingDirection
@@ -8,12 +8,10 @@ Locks the keystone fixes the diagnostics framework surfaced:
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.scenario import run_scenario, jab_knockback
 from street_fighter_3rd.data.constants import STAGE_LEFT_BOUND, STAGE_RIGHT_BOUND
 
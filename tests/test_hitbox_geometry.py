@@ -11,9 +11,11 @@ Baston jab active box raw [X=-48, W=14] -> PyKuma edge offset_x = -X - W = 34, w
 Baston pushbox raw [X=-25, W=50] -> PyKuma center offset_x = -(X + W/2) = 0, width 50.
 """
 
+import random
+
 import pygame
 
-from street_fighter_3rd.systems.sf3_hitboxes import SF3Hitbox
+from street_fighter_3rd.systems.sf3_hitboxes import SF3Hitbox, SF3HitboxFrame, SF3HitboxType
 from street_fighter_3rd.systems.sf3_collision_adapter import SF3CollisionAdapter
 from street_fighter_3rd.systems.vfx import VFXManager
 from street_fighter_3rd.characters.akuma import Akuma
@@ -83,3 +85,35 @@ def test_collision_is_facing_symmetric():
         assert hit_left, "MP must hit symmetrically when facing left (regression: get_rect mirror)"
     finally:
         pygame.quit()
+
+
+def test_overlaps_matches_rect_collision():
+    """overlaps() skips building Rects; it must agree with get_rect/colliderect."""
+    rng = random.Random(3)
+
+    def box():
+        return SF3Hitbox(offset_x=rng.uniform(-80, 80), offset_y=rng.uniform(-150, 10),
+                         width=rng.choice([0, 0.5, rng.uniform(1, 90)]),
+                         height=rng.choice([0, rng.uniform(1, 90)]),
+                         anchor=rng.choice(["edge", "center"]))
+
+    for _ in range(5000):
+        a, b = box(), box()
+        pa = (rng.uniform(-50, 250), rng.uniform(-20, 220))
+        pb = (rng.uniform(-50, 250), rng.uniform(-20, 220))
+        fa, fb = rng.choice([1, -1]), rng.choice([1, -1])
+        expected = a.get_rect(*pa, fa).colliderect(b.get_rect(*pb, fb))
+        assert a.overlaps(b, pa, fa, pb, fb) == expected
+
+
+def test_frame_box_lists_by_type():
+    """add_hitbox and get_hitboxes_by_type address the same per-type list."""
+    frame = SF3HitboxFrame()
+    boxes = {t: SF3Hitbox(width=i + 1) for i, t in enumerate(SF3HitboxType)}
+    for box_type, box in boxes.items():
+        frame.add_hitbox(box_type, box)
+
+    for box_type, box in boxes.items():
+        assert frame.get_hitboxes_by_type(box_type) == [box]
+        assert frame.has_active_hitboxes(box_type)
+    assert frame.attack_boxes == [boxes[SF3HitboxType.ATTACK]]
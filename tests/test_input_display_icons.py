@@ -5,12 +5,10 @@ error (it previously drew text glyphs).
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from street_fighter_3rd.core.game import Game
 
 
@@ -7,13 +7,11 @@ unbounded number of hits (the infinite juggle).
 """
 
 import os
-import sys
 from types import SimpleNamespace
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.harness import new_game
 from street_fighter_3rd.characters.character import (
     apply_reaction, LAUNCH_VELOCITY, JUGGLE_LIMIT,
@@ -9,12 +9,10 @@ safety net).
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.scenario import run_scenario, launch_recovery
 from street_fighter_3rd.data.constants import STAGE_FLOOR, SCREEN_HEIGHT
 
@@ -10,12 +10,10 @@ measures the actually-drawn body center; it fails if the anchoring regresses.
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.harness import new_game
 from tools.diagnostics.scenario import ScriptedInputSystem, hold
 from street_fighter_3rd.data.enums import InputDirection, FacingDirection, CharacterState
@@ -5,12 +5,10 @@ Uses NORMAL mode (TRAINING/DEV are no_rounds=True, so the round flow is skipped)
 """
 
 import os
-import sys
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.harness import new_game
 from street_fighter_3rd.data.enums import GameState, RoundResult
 
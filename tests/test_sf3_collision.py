@@ -4,7 +4,7 @@ Tests for the SF3 collision system components and the adapter wiring.
 
 from street_fighter_3rd.systems.sf3_collision import SF3CollisionSystem
 from street_fighter_3rd.systems.sf3_core import SF3PlayerWork
-from street_fighter_3rd.systems.sf3_hitboxes import SF3HitboxManager
+from street_fighter_3rd.systems.sf3_hitboxes import SF3Hitbox, SF3HitboxManager
 from street_fighter_3rd.systems.sf3_collision_adapter import SF3CollisionAdapter
 
 
@@ -35,9 +35,25 @@ def test_sf3_collision_system():
     assert collision_system.hit_queue_input == 0, "hit queue must be empty after processing"
 
 
-def test_sf3_adapter():
+def test_queued_hits_reuse_the_preallocated_slots():
+    """_queue_hit fills the 32 HS slots in place and resets stale fields."""
+    collision_system = SF3CollisionSystem()
+    slots = list(collision_system.hit_status)
+    attacker, defender = SF3PlayerWork(), SF3PlayerWork()
+    attacker.work.player_number, defender.work.player_number = 1, 2
+
+    collision_system.hit_status[0].stun = 99  # left over from an earlier frame
+    collision_system._queue_hit(attacker, defender, SF3Hitbox(damage=30), (10.0, 20.0))
+
+    assert all(a is b for a, b in zip(collision_system.hit_status, slots))
+    hit = collision_system.hit_status[0]
+    assert (hit.attacker_id, hit.defender_id, hit.damage, hit.stun) == (1, 2, 30, 0)
+    assert collision_system.hit_queue_input == 1
+
+
+def test_sf3_adapter(collision_adapter):
     """SF3CollisionAdapter initializes persistent per-player state."""
-    adapter = SF3CollisionAdapter()
+    adapter = collision_adapter
 
     assert adapter.frame_counter == 0
     assert set(adapter.player_works.keys()) == {1, 2}, (
@@ -49,3 +65,17 @@ def test_sf3_adapter():
     adapter.tick()
     assert adapter.frame_counter == 1
     assert adapter.sf3_system.current_frame == 1
+
+
+def test_shared_adapter_is_reused_and_reset(collision_adapter):
+    """instance() hands back one adapter; reset() rewinds it without rebuilding."""
+    assert SF3CollisionAdapter.instance() is collision_adapter
+    works = dict(collision_adapter.player_works)
+
+    collision_adapter.tick()
+    collision_adapter.sf3_combo_system.register_hit(1, 2, 100)
+    collision_adapter.reset()
+
+    assert collision_adapter.frame_counter == 0
+    assert collision_adapter.get_combo_info(2)['count'] == 0
+    assert collision_adapter.player_works == works, "reset keeps the persistent works"
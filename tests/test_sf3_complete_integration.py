@@ -9,25 +9,25 @@ Tests all the major SF3 systems we've integrated:
 5. Game wired to the SF3 collision adapter
 """
 
-from pathlib import Path
+from importlib import resources
 
 import pygame
 import pytest
-import yaml
 
+from street_fighter_3rd.core.game import Game
 from street_fighter_3rd.systems.sf3_collision_adapter import SF3CollisionAdapter
 from street_fighter_3rd.systems.sf3_combo_system import SF3ComboSystem
 from street_fighter_3rd.systems.sf3_parry import SF3ParrySystem
+from street_fighter_3rd.util import yaml_fast
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-ANIMATIONS_YAML = PROJECT_ROOT / "src" / "street_fighter_3rd" / "data" / "animations.yaml"
+# Package data, resolved through the installed package rather than a CWD- or
+# checkout-relative path.
+ANIMATIONS_YAML = resources.files("street_fighter_3rd.data").joinpath("animations.yaml")
 
 
-def test_sf3_collision_adapter():
+def test_sf3_collision_adapter(collision_adapter):
     """SF3CollisionAdapter exposes combo info in the format the UI expects."""
-    adapter = SF3CollisionAdapter()
-
-    combo_info = adapter.get_combo_info(1)
+    combo_info = collision_adapter.get_combo_info(1)
     assert combo_info['count'] == 0, "no hits yet: combo count must start at 0"
     assert combo_info['damage'] == 0, "no hits yet: combo damage must start at 0"
     assert combo_info['active'] is False, "no combo can be active before any hit"
@@ -53,6 +53,14 @@ def test_combo_system():
     assert scaled_damage_3 == 80, f"3rd hit must scale to 80, got {scaled_damage_3}"
 
 
+def test_combo_scaling_uses_integer_math():
+    """Scaling is integer percent math: 90 dmg at 70% is 63, not float-truncated 62."""
+    combo_system = SF3ComboSystem()
+    damages = [combo_system.register_hit(1, 2, 90, "normal", defender_in_hitstun=(i > 0))
+               for i in range(4)]
+    assert damages == [90, 81, 72, 63]
+
+
 def test_combo_resets_when_defender_recovers():
     """Mashing on a recovered defender must NOT rack a fake multi-hit combo.
 
@@ -69,10 +77,9 @@ def test_combo_resets_when_defender_recovers():
 
 def test_yaml_hitbox_loading():
     """The animations YAML contains hitbox data for Akuma's moves."""
-    assert ANIMATIONS_YAML.exists(), f"animation data file missing: {ANIMATIONS_YAML}"
+    assert ANIMATIONS_YAML.is_file(), f"animation data file missing: {ANIMATIONS_YAML}"
 
-    with open(ANIMATIONS_YAML, 'r') as f:
-        anim_data = yaml.safe_load(f)
+    anim_data = yaml_fast.load(ANIMATIONS_YAML)
 
     akuma_anims = anim_data.get('characters', {}).get('akuma', {}).get('animations', {})
     assert akuma_anims, "animations.yaml must define animations for akuma"
@@ -100,17 +107,14 @@ def test_sf3_parry_system():
     )
 
 
-def test_game_integration():
+def test_game_integration(pygame_screen):
     """The Game wires up the SF3 collision adapter."""
-    from street_fighter_3rd.core.game import Game
-
-    pygame.init()
     try:
-        screen = pygame.display.set_mode((800, 600))
-        game = Game(screen)
+        game = Game(pygame_screen)
 
-        assert hasattr(game.collision_system, 'sf3_combo_system'), (
+        assert isinstance(game.collision_system, SF3CollisionAdapter), (
             "Game must use SF3CollisionAdapter as its collision system"
         )
     finally:
-        pygame.quit()
+        pygame.font.quit()
+        pygame.display.quit()
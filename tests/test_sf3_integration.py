@@ -11,7 +11,7 @@ Tests the integration of the authentic SF3 subsystems:
 import pytest
 
 from street_fighter_3rd.systems.sf3_core import (
-    SF3GamePhase, SF3StateCategory, create_sf3_player, SF3_DAMAGE_SCALING,
+    SF3GamePhase, SF3StateCategory, create_sf3_player, scaled_damage, SF3_DAMAGE_SCALING,
 )
 from street_fighter_3rd.systems.sf3_collision import (
     SF3CollisionSystem, SF3CollisionEvent,
@@ -135,17 +135,16 @@ def test_combo_scenario(player2):
     player2.combo_count = 0
 
     base_damage = 100
-    for hit in range(5):
+    last = len(SF3_DAMAGE_SCALING) - 1
+    # Hit 0 reads the 100% entry, so no first-hit special case is needed.
+    expected_damages = [base_damage * SF3_DAMAGE_SCALING[min(hit, last)] // 100
+                        for hit in range(5)]
+
+    for hit, expected in enumerate(expected_damages):
         old_health = player2.work.vitality
         player2.apply_damage(base_damage, combo_scaling=True)
         player2.increment_combo()
         actual_damage = old_health - player2.work.vitality
-
-        if hit == 0:
-            expected = base_damage  # First hit: 100%
-        else:
-            scale = SF3_DAMAGE_SCALING[min(hit, len(SF3_DAMAGE_SCALING) - 1)]
-            expected = int(base_damage * scale / 100)
         assert actual_damage == expected, f"Hit {hit + 1}: expected {expected}, got {actual_damage}"
 
 
@@ -159,5 +158,14 @@ def test_state_machine_integration(player1):
     player1.work.set_routine_state(SF3GamePhase.GAMEPLAY, SF3StateCategory.DAMAGED, 2)
     assert player1.work.is_damaged()
     assert not player1.work.is_attacking()
+    assert player1.work.old_routine_no[:3] == [
+        SF3GamePhase.GAMEPLAY.value, SF3StateCategory.ATTACKING.value, 5
+    ], "the previous routine is kept for rollback"
 
     assert len(player1.work.routine_no) == 8
+
+
+def test_scaled_damage_table():
+    """scaled_damage() indexes the SF3 table and clamps at its last entry."""
+    assert [scaled_damage(115, hit) for hit in range(4)] == [115, 103, 92, 80]
+    assert scaled_damage(100, 9) == scaled_damage(100, 50) == 10
@@ -0,0 +1,89 @@
+"""Broad-phase spatial hash and the crowded-check path in SF3CollisionSystem."""
+
+import pygame
+
+from street_fighter_3rd.systems.spatial_hash import SpatialHashGrid, BROAD_PHASE_MIN_BOXES
+from street_fighter_3rd.systems.sf3_collision import SF3CollisionSystem
+from street_fighter_3rd.systems.sf3_core import SF3PlayerWork
+from street_fighter_3rd.systems.sf3_hitboxes import (
+    SF3Hitbox, SF3HitboxAnimation, SF3HitboxFrame, SF3HitboxManager, SF3HitboxType)
+
+
+def test_query_returns_neighbours_once():
+    grid = SpatialHashGrid(cell_size=32)
+    wide = pygame.Rect(0, 0, 100, 10)      # spans 4 cells
+    far = pygame.Rect(500, 500, 10, 10)
+    grid.insert("wide", wide)
+    grid.insert("far", far)
+
+    found = [item for item, _ in grid.query(pygame.Rect(10, 0, 80, 5))]
+    assert found == ["wide"], "an item spanning several cells is reported once"
+    assert grid.query(pygame.Rect(200, 200, 5, 5)) == []
+
+
+def test_clear_keeps_buckets_but_empties_them():
+    grid = SpatialHashGrid()
+    grid.insert("a", pygame.Rect(0, 0, 10, 10))
+    grid.clear()
+    assert grid.query(pygame.Rect(0, 0, 10, 10)) == []
+    assert grid._cells, "buckets are reused across frames, not reallocated"
+
+
+def _manager(name, boxes_by_type):
+    frame = SF3HitboxFrame(frame_number=1)
+    for box_type, boxes in boxes_by_type.items():
+        for box in boxes:
+            frame.add_hitbox(box_type, box)
+    anim = SF3HitboxAnimation(animation_name="a", total_frames=1)
+    anim.add_frame(1, frame)
+    mgr = SF3HitboxManager(name)
+    mgr.animations["a"] = anim
+    mgr.current_animation, mgr.current_frame = "a", 1
+    return mgr
+
+
+def _player(player_number, x, face):
+    work = SF3PlayerWork()
+    work.work.player_number = player_number
+    work.work.position.x, work.work.position.y = float(x), 200.0
+    work.work.face = face
+    return work
+
+
+def test_crowded_check_matches_brute_force():
+    """Above the threshold the grid path must queue the same hit as brute force."""
+    # Many hurtboxes well out of reach plus one the second attack box touches.
+    targets = [SF3Hitbox(offset_x=i * 40, offset_y=-300, width=20, height=20, anchor="center")
+               for i in range(BROAD_PHASE_MIN_BOXES)]
+    targets.append(SF3Hitbox(offset_x=0, offset_y=-80, width=40, height=80, anchor="center"))
+    whiff = SF3Hitbox(offset_x=0, offset_y=-500, width=10, height=10, damage=1)
+    connect = SF3Hitbox(offset_x=10, offset_y=-60, width=60, height=20, damage=99)
+
+    p1, p2 = _player(1, 100, 1), _player(2, 150, -1)
+    att = _manager("p1", {SF3HitboxType.ATTACK: [whiff, connect]})
+    dfn = _manager("p2", {SF3HitboxType.BODY: targets})
+
+    system = SF3CollisionSystem()
+    system._check_player_attacks(p1, p2, att, dfn, (100, 200), (150, 200))
+    assert system.hit_queue_input == 1
+    assert system.hit_status[0].damage == 99, "the connecting box, not the whiff, is queued"
+    assert system.broad_phase[2].cell_size == 160, "cells are 2x the largest hurtbox edge"
+
+
+def test_update_only_moves_entries_across_cell_boundaries():
+    grid = SpatialHashGrid(cell_size=32)
+    grid.update("hurt", "v1", pygame.Rect(0, 0, 10, 10))
+    bucket = grid._cells[(0, 0)]
+
+    # Nudged but still inside cell (0, 0): payload refreshed, bucket untouched.
+    grid.update("hurt", "v2", pygame.Rect(5, 5, 10, 10))
+    assert grid._cells[(0, 0)] is bucket and len(bucket) == 1
+    assert [item for item, _ in grid.query(pygame.Rect(0, 0, 1, 1))] == ["v2"]
+
+    # Crossed into cell (2, 0): leaves the old bucket, joins the new one.
+    grid.update("hurt", "v3", pygame.Rect(70, 5, 10, 10))
+    assert grid.query(pygame.Rect(0, 0, 1, 1)) == []
+    assert [item for item, _ in grid.query(pygame.Rect(72, 6, 1, 1))] == ["v3"]
+
+    grid.remove("hurt")
+    assert grid.query(pygame.Rect(72, 6, 1, 1)) == [] and grid.keys() == []
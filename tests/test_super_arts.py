@@ -6,13 +6,11 @@ SA3 = 214214P heavy hit. Also covers the now-wired projectile-vs-character hit.
 """
 
 import os
-import sys
 from types import SimpleNamespace
 
 import pygame
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.diagnostics.harness import new_game
 from tools.diagnostics.scenario import ScriptedInputSystem, hold, qcf
 from street_fighter_3rd.data.enums import Button, InputDirection, FacingDirection, CharacterState
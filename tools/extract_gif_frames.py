@@ -2,76 +2,123 @@
 """Extract individual frames from Akuma animation GIFs and map them to sprite numbers."""
 
 import sys
-from PIL import Image, ImageChops
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from PIL import Image, ImageSequence
 import os
-import urllib.request
 import json
 
+import requests
+
+# Animations processed at once by --all. Each worker mostly waits on the network, and
+# Pillow's decode/convert run in C, so threads overlap well without each one
+# reloading the sprite directory as separate processes would.
+MAX_WORKERS = 4
+
+# Seconds to wait for the server to connect or send the next chunk.
+DOWNLOAD_TIMEOUT = 30
+
+# Shared keep-alive session: every download reuses pooled connections instead
+# of forking curl and paying a TLS handshake per animation.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+})
+
 def download_gif(animation_name, output_path):
     """Download a GIF from justnopoint.com."""
     url = f"https://www.justnopoint.com/zweifuss/colorswap.php?pcolorstring=AkumaPalette.bin&pcolornum=7&pname=akuma/{animation_name}.gif"
     print(f"Downloading {animation_name}...")
 
-    # Use subprocess.run with curl instead of urllib (server rejects Python user agent)
-    import subprocess
-    result = subprocess.run(['curl', '-s', '-o', output_path, url], capture_output=True)
-    if result.returncode != 0:
-        raise Exception(f"Failed to download: {result.stderr.decode()}")
+    # The server rejects Python's default user agent; _SESSION sends a browser one.
+    # Chunks land in a .part file that replaces output_path only once complete,
+    # so a dropped connection never leaves a truncated GIF behind.
+    part_path = output_path + ".part"
+    with _SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        if not response.ok:
+            raise Exception(f"Failed to download: HTTP {response.status_code}")
+        with open(part_path, 'wb') as f:
+            for chunk in response.iter_content(64 * 1024):
+                f.write(chunk)
+    os.replace(part_path, output_path)
 
     print(f"  Saved to {output_path}")
 
-def extract_frames(gif_path, output_dir):
-    """Extract all frames from a GIF file."""
-    img = Image.open(gif_path)
-    frames = []
+def extract_frames(gif_path, dump_dir=None):
+    """Decode all frames of a GIF into RGBA images, in memory.
 
-    try:
-        frame_num = 0
-        while True:
-            # Save current frame
-            frame_path = os.path.join(output_dir, f"frame_{frame_num:03d}.png")
-            img.save(frame_path, 'PNG')
-            frames.append(frame_path)
+    Frames go straight to the matcher, so nothing is written unless dump_dir
+    is given, in which case each frame is also saved there as a PNG.
+    """
+    frames = []
 
-            frame_num += 1
-            img.seek(img.tell() + 1)
-    except EOFError:
-        pass  # End of frames
+    # One forward pass over the frames (ImageSequence seeks 0, 1, 2, ...)
+    with Image.open(gif_path) as img:
+        for gif_frame in ImageSequence.Iterator(img):
+            frame = gif_frame.convert('RGBA')
+            if dump_dir is not None:
+                # Scratch output: favour encode speed over file size.
+                frame.save(os.path.join(dump_dir, f"frame_{len(frames):03d}.png"), 'PNG',
+                           compress_level=1)
+            frames.append(frame)
 
     print(f"  Extracted {len(frames)} frames")
     return frames
 
-def find_matching_sprite(frame_path, sprite_dir):
-    """Find which sprite number matches this frame (if any)."""
-    frame = Image.open(frame_path).convert('RGBA')
-
-    # Try to find exact match in sprite directory
-    for sprite_file in sorted(os.listdir(sprite_dir)):
-        if not sprite_file.endswith('.png'):
-            continue
-
-        sprite_path = os.path.join(sprite_dir, sprite_file)
-        sprite = Image.open(sprite_path).convert('RGBA')
-
-        # Resize to same dimensions for comparison
-        if frame.size != sprite.size:
-            # Try both: resize frame to sprite, and sprite to frame
-            if frame.size[0] <= sprite.size[0] and frame.size[1] <= sprite.size[1]:
-                # Frame is smaller, compare with cropped sprite
-                diff = ImageChops.difference(frame, sprite.crop((0, 0, frame.size[0], frame.size[1])))
-            else:
-                continue  # Sizes incompatible
-        else:
-            diff = ImageChops.difference(frame, sprite)
-
-        # Check if images are identical (all pixels have diff of 0)
-        if diff.getbbox() is None:
-            sprite_num = sprite_file.replace('.png', '')
-            return sprite_num
+# Decoded sprites are held per directory; a handful of directories is plenty
+# for one run and bounds the memory if the functions are driven over many.
+SPRITE_CACHE_DIRS = 4
+
+@lru_cache(maxsize=SPRITE_CACHE_DIRS)
+def load_sprites(sprite_dir):
+    """Load every sprite PNG in sprite_dir once, as (name, size, RGBA bytes) in name order."""
+    with os.scandir(sprite_dir) as entries:
+        sprite_files = sorted(e.name for e in entries if e.name.endswith('.png'))
+
+    sprites = []
+    for sprite_file in sprite_files:
+        with Image.open(os.path.join(sprite_dir, sprite_file)) as sprite:
+            rgba = sprite.convert('RGBA')
+        sprites.append((sprite_file.replace('.png', ''), rgba.size, rgba.tobytes()))
+
+    return tuple(sprites)
+
+@lru_cache(maxsize=SPRITE_CACHE_DIRS)
+def sprite_index(sprite_dir):
+    """Map (size, RGBA bytes) -> sprite name; the first name wins on duplicates."""
+    index = {}
+    for sprite_num, size, sprite_bytes in load_sprites(sprite_dir):
+        index.setdefault((size, sprite_bytes), sprite_num)
+    return index
+
+def find_matching_sprite(frame, sprite_dir):
+    """Find which sprite number matches this RGBA frame image (if any)."""
+    frame_bytes = frame.tobytes()
+    width, height = frame.size
+
+    # Same-size exact match: one dict probe. The bytes hash is computed once
+    # per frame and the dict confirms hits with a full compare.
+    sprite_num = sprite_index(sprite_dir).get((frame.size, frame_bytes))
+    if sprite_num is not None:
+        return sprite_num
+
+    # Frame is smaller than some sprites: compare it with each sprite's top-left
+    # corner. Frame rows are sliced once; each is checked in place against the
+    # sprite's bytes at that row's offset (startswith is a memcmp, no crop copy),
+    # stopping at the first row that differs.
+    row_len = width * 4
+    frame_rows = [frame_bytes[y * row_len:(y + 1) * row_len] for y in range(height)]
+    for sprite_num, size, sprite_bytes in load_sprites(sprite_dir):
+        if size != frame.size and width <= size[0] and height <= size[1]:
+            stride = size[0] * 4
+            if all(sprite_bytes.startswith(row, y * stride)
+                   for y, row in enumerate(frame_rows)):
+                return sprite_num
 
     return None
 
-def analyze_animation(animation_name, sprite_dir="./14_Akuma"):
+def analyze_animation(animation_name, sprite_dir="./14_Akuma", dump_frames=False):
     """Download GIF, extract frames, and map to sprite numbers."""
     # Create temp directory for this animation
     temp_dir = f"/tmp/akuma_frames/{animation_name}"
@@ -82,13 +129,13 @@ def analyze_animation(animation_name, sprite_dir="./14_Akuma"):
     download_gif(animation_name, gif_path)
 
     # Extract frames
-    frames = extract_frames(gif_path, temp_dir)
+    frames = extract_frames(gif_path, temp_dir if dump_frames else None)
 
     # Try to match each frame to a sprite
     print(f"  Matching frames to sprites...")
     sprite_sequence = []
-    for i, frame_path in enumerate(frames):
-        sprite_num = find_matching_sprite(frame_path, sprite_dir)
+    for i, frame in enumerate(frames):
+        sprite_num = find_matching_sprite(frame, sprite_dir)
         if sprite_num:
             sprite_sequence.append(sprite_num)
             print(f"    Frame {i}: {sprite_num}.png")
@@ -103,27 +150,37 @@ def analyze_animation(animation_name, sprite_dir="./14_Akuma"):
     }
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python extract_gif_frames.py <animation-name>")
+    args = sys.argv[1:]
+    # --dump-frames also writes each decoded frame as a PNG next to the GIF.
+    dump_frames = "--dump-frames" in args
+    args = [arg for arg in args if arg != "--dump-frames"]
+
+    if not args:
+        print("Usage: python extract_gif_frames.py <animation-name> [--dump-frames]")
         print("Example: python extract_gif_frames.py akuma-stance")
         print("\nOr: python extract_gif_frames.py --all")
         sys.exit(1)
 
-    animation_name = sys.argv[1]
+    animation_name = args[0]
 
     if animation_name == "--all":
         # Process all animations from list
         with open("/tmp/akuma_animations.txt") as f:
             animations = [line.strip() for line in f if line.strip()]
 
+        # Load the sprites once up front rather than racing to in every worker.
+        sprite_index("./14_Akuma")
+
         results = {}
-        for anim in animations:
-            try:
-                result = analyze_animation(anim)
-                results[anim] = result
-            except Exception as e:
-                print(f"  ERROR: {e}")
-                results[anim] = {"error": str(e)}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = {anim: pool.submit(analyze_animation, anim, dump_frames=dump_frames)
+                       for anim in animations}
+            for anim, future in futures.items():
+                try:
+                    results[anim] = future.result()
+                except Exception as e:
+                    print(f"  ERROR ({anim}): {e}")
+                    results[anim] = {"error": str(e)}
 
         # Save results
         output_file = "./akuma_animation_mapping.json"
@@ -132,7 +189,7 @@ def main():
         print(f"\nSaved all results to {output_file}")
     else:
         # Process single animation
-        result = analyze_animation(animation_name)
+        result = analyze_animation(animation_name, dump_frames=dump_frames)
         print(f"\nResult:")
         print(json.dumps(result, indent=2))
 
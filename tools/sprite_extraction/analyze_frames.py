@@ -17,16 +17,10 @@ current_sprite = 18320
 for anim_name, filename in gifs.items():
     print(f"\nAnalyzing {anim_name} ({filename})...")
 
-    img = Image.open(filename)
-
-    # Get number of frames
-    frame_count = 0
-    try:
-        while True:
-            img.seek(frame_count)
-            frame_count += 1
-    except EOFError:
-        pass
+    # Get number of frames. n_frames walks the frame headers without
+    # compositing each frame the way seek() does (single-frame files lack it).
+    with Image.open(filename) as img:
+        frame_count = getattr(img, 'n_frames', 1)
 
     print(f"  Found {frame_count} frames")
 
@@ -36,7 +30,7 @@ for anim_name, filename in gifs.items():
         'start': start_sprite,
         'end': start_sprite + frame_count - 1,
         'count': frame_count,
-        'frames': list(range(start_sprite, start_sprite + frame_count))
+        'frames': range(start_sprite, start_sprite + frame_count)
     }
 
     current_sprite += frame_count
@@ -49,7 +43,7 @@ for anim_name, mapping in sprite_mappings.items():
     print(f"\n# {anim_name.replace('_', ' ').title()} ({mapping['count']} frames)")
     print(f"# Sprites {mapping['start']}-{mapping['end']}")
     print(f"{anim_name}_anim = create_simple_animation(")
-    print(f"    {mapping['frames']},")
+    print(f"    {list(mapping['frames'])},")
     print(f"    frame_duration=2,  # Adjust as needed")
     print(f"    loop=False  # Set to True if looping")
     print(f")")
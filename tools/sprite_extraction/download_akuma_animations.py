@@ -4,13 +4,31 @@ import requests
 from bs4 import BeautifulSoup
 import os
 import re
-from PIL import Image
+from PIL import Image, ImageSequence
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 # Base URL for the GIFs
 BASE_GIF_URL = "https://www.justnopoint.com/zweifuss/colorswap.php?pcolorstring=AkumaPalette.bin&pcolornum=7&pname=akuma/"
 
+# One keep-alive session for every GIF, so the TCP/TLS handshake happens once
+# per pooled connection instead of once per animation.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+})
+
+# Animations downloaded at once. Kept small so the server sees a few
+# connections, not one per animation.
+DOWNLOAD_WORKERS = 4
+
+# Seconds to wait for the server to connect or send the next chunk.
+DOWNLOAD_TIMEOUT = 30
+
 def fetch_html_content(url):
     """Fetch the HTML content from the Akuma page."""
     print(f"Fetching HTML from {url}...")
@@ -63,20 +81,17 @@ def download_gif(animation_name, output_dir="akuma_gifs"):
     
     print(f"Downloading {gif_filename}...")
     
-    # Headers to mimic a real browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Connection': 'keep-alive',
-    }
-    
     try:
-        response = requests.get(gif_url, headers=headers)
-        response.raise_for_status()
-        
-        with open(local_path, 'wb') as f:
-            f.write(response.content)
+        # iter_content turns a dropped connection into a RequestException, and
+        # the .part file keeps a truncated GIF from being left at local_path.
+        part_path = local_path + ".part"
+        with _SESSION.get(gif_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            
+            with open(part_path, 'wb') as f:
+                for chunk in response.iter_content(64 * 1024):
+                    f.write(chunk)
+        os.replace(part_path, local_path)
         
         print(f"  ✓ Downloaded to {local_path}")
         return local_path
@@ -98,33 +113,45 @@ def extract_gif_frames(gif_path, animation_name, base_output_dir="akuma_animatio
     print(f"Extracting frames from {animation_name}.gif...")
     
     try:
-        img = Image.open(gif_path)
         frame_count = 0
         
-        while True:
-            try:
+        # One forward pass over the frames (ImageSequence seeks 0, 1, 2, ...)
+        with Image.open(gif_path) as img:
+            for gif_frame in ImageSequence.Iterator(img):
                 # Save current frame
                 frame_filename = f"frame_{frame_count:03d}.png"
                 output_path = os.path.join(output_dir, frame_filename)
                 
                 # Convert to RGBA if needed
-                frame = img.convert('RGBA')
-                frame.save(output_path, 'PNG')
+                frame = gif_frame.convert('RGBA')
+                # Reference frames, not shipped sprites: a light zlib level
+                # encodes several times faster for slightly larger files.
+                frame.save(output_path, 'PNG', compress_level=1)
                 
                 print(f"  Saved frame {frame_count} as {frame_filename}")
-                
-                # Move to next frame
                 frame_count += 1
-                img.seek(frame_count)
-                
-            except EOFError:
-                break
         
         print(f"  ✓ Extracted {frame_count} frames to {output_dir}")
         
     except Exception as e:
         print(f"  ✗ Error extracting frames: {e}")
 
+def process_animation(animation_name, index, total):
+    """Download one animation's GIF and extract its frames; True on success."""
+    print(f"[{index}/{total}] Processing {animation_name}...")
+
+    # Download the GIF
+    gif_path = download_gif(animation_name)
+
+    # Small delay to be respectful to the server (per worker, before its next request)
+    time.sleep(0.5)
+    if not gif_path:
+        return False
+
+    # Extract frames from the GIF
+    extract_gif_frames(gif_path, animation_name)
+    return True
+
 def main():
     """Main function to download and extract all Akuma animations."""
     # URL of the Akuma page
@@ -146,26 +173,15 @@ def main():
     
     print(f"\n=== Downloading {len(animation_names)} animations ===\n")
     
-    # Step 3: Download and extract each animation
-    successful_downloads = 0
-    failed_downloads = 0
-    
-    for i, animation_name in enumerate(animation_names, 1):
-        print(f"[{i}/{len(animation_names)}] Processing {animation_name}...")
-        
-        # Download the GIF
-        gif_path = download_gif(animation_name)
-        
-        if gif_path:
-            # Extract frames from the GIF
-            extract_gif_frames(gif_path, animation_name)
-            successful_downloads += 1
-        else:
-            failed_downloads += 1
-        
-        # Small delay to be respectful to the server
-        time.sleep(0.5)
-        print()
+    # Step 3: Download and extract each animation. Downloads are network-bound,
+    # so a few run at once; each worker extracts its GIF as soon as it lands.
+    total = len(animation_names)
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        outcomes = list(pool.map(process_animation, animation_names,
+                                 range(1, total + 1), [total] * total))
+    successful_downloads = sum(outcomes)
+    failed_downloads = total - successful_downloads
+    print()
     
     # Summary
     print("=== Summary ===")
@@ -10,21 +10,41 @@ high-quality character portraits for the selection interface.
 """
 
 import requests
+import json
 import os
+import shutil
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 import re
 
 class SF3PortraitDownloader:
     """Downloads SF3 character portraits from justnopoint.com"""
     
+    # Retries for a throttled (429/503) request before giving up on it
+    MAX_RETRIES = 3
+    
     def __init__(self, output_dir: str = "character_portraits"):
         self.base_url = "https://www.justnopoint.com/zweifuss/"
         self.output_dir = Path(__file__).parent / output_dir
         self.output_dir.mkdir(exist_ok=True)
         
+        # One keep-alive session for every probe and download, so pattern
+        # misses reuse the open connection instead of reconnecting each time
+        self.session = requests.Session()
+        
+        # URL that served each character's portrait, tried first on later
+        # calls for the same character
+        self.portrait_urls: Dict[str, str] = {}
+        
+        # PNG URLs linked from the base page, fetched once on first use
+        # (see _linked_pngs); None until then
+        self._index: Optional[Set[str]] = None
+        self._index_lock = threading.Lock()
+        
         # SF3:3S character mapping
         self.sf3_characters = {
             "akuma": "Akuma",
@@ -80,49 +100,163 @@ class SF3PortraitDownloader:
         
         success = False
         
-        for pattern in portrait_patterns:
-            url = urljoin(self.base_url, pattern)
-            
+        urls = [urljoin(self.base_url, pattern) for pattern in portrait_patterns]
+        
+        # Probe the patterns the base page links to first; if it links none of
+        # them (or the page couldn't be read), fall back to every pattern
+        linked = self._linked_pngs()
+        urls = [url for url in urls if url in linked] or urls
+        
+        # Try the URL that worked last time first; the rest stay as fallbacks
+        known_url = self.portrait_urls.get(character_name)
+        if known_url in urls:
+            urls.remove(known_url)
+            urls.insert(0, known_url)
+        
+        for url in urls:
             try:
                 print(f"Trying: {url}")
-                response = requests.get(url, timeout=10)
+                # HEAD first: a missing pattern costs a header round trip, not a
+                # page body. 405 means the server won't answer HEAD, so GET it.
+                probe = self._request("HEAD", url, allow_redirects=True, timeout=10)
                 
-                if response.status_code == 200:
-                    # Save the portrait
+                if probe.status_code in (200, 405):
                     output_file = self.output_dir / f"{character_name}_{portrait_type}.png"
+                    meta_file = output_file.with_name(output_file.name + ".meta.json")
                     
-                    with open(output_file, 'wb') as f:
-                        f.write(response.content)
+                    # Conditional GET: an unchanged portrait comes back as an
+                    # empty 304 instead of the whole image. The body is streamed
+                    # to disk in 64 KiB chunks rather than held in memory.
+                    with self._request(
+                        "GET", url, headers=self._conditional_headers(url, output_file, meta_file),
+                        timeout=10, stream=True
+                    ) as response:
+                        if response.status_code == 304:
+                            print(f"✅ {character_name} portrait unchanged: {output_file}")
+                            success = True
+                        
+                        elif response.status_code == 200:
+                            # Save the portrait. Write to a .part file and swap it in,
+                            # so an interrupted download never leaves a truncated PNG
+                            # that a later conditional GET would keep as "unchanged".
+                            partial_file = output_file.with_name(output_file.name + ".part")
+                            response.raw.decode_content = True
+                            with open(partial_file, 'wb') as f:
+                                shutil.copyfileobj(response.raw, f, 64 * 1024)
+                            os.replace(partial_file, output_file)
+                            self._save_validators(meta_file, url, response)
+                            
+                            print(f"✅ Downloaded {character_name} portrait: {output_file}")
+                            success = True
                     
-                    print(f"✅ Downloaded {character_name} portrait: {output_file}")
-                    success = True
-                    break
+                    if success:
+                        self.portrait_urls[character_name] = url
+                        break
                     
             except Exception as e:
                 print(f"⚠️ Failed to download {url}: {e}")
                 continue
-            
-            # Be respectful to the server
-            time.sleep(0.5)
         
         if not success:
             print(f"❌ Could not find portrait for {character_name}")
         
         return success
     
-    def download_all_portraits(self) -> Dict[str, bool]:
-        """Download portraits for all SF3 characters"""
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Session request that backs off only when the server asks it to
+        
+        A 429 or 503 is retried up to MAX_RETRIES times, waiting for the
+        Retry-After seconds when given, otherwise 0.5s doubling each time.
+        Other responses return at once; there is no fixed per-request delay.
+        """
+        
+        delay = 0.5
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in (429, 503) or attempt == self.MAX_RETRIES:
+                return response
+            
+            retry_after = response.headers.get("Retry-After", "")
+            wait = float(retry_after) if retry_after.isdigit() else delay
+            response.close()
+            print(f"⏳ {url} throttled ({response.status_code}), retrying in {wait:g}s")
+            time.sleep(wait)
+            delay *= 2
+    
+    def _linked_pngs(self) -> Set[str]:
+        """
+        Absolute URLs of the PNGs the base page links or embeds
+        
+        Fetched once per downloader (the lock keeps parallel character
+        downloads from each fetching it). An empty set means the page
+        couldn't be read or has no PNGs; callers probe every pattern whenever
+        none of their candidates are in it.
+        """
+        
+        with self._index_lock:
+            if self._index is None:
+                try:
+                    response = self._request("GET", self.base_url, timeout=10)
+                    response.raise_for_status()
+                    # <a href> and <img src>, quoted either way
+                    hrefs = re.findall(r"""(?:href|src)\s*=\s*["']([^"']+\.png)["']""",
+                                       response.text, re.IGNORECASE)
+                    self._index = {urljoin(self.base_url, href) for href in hrefs}
+                except Exception as e:
+                    print(f"⚠️ Could not read {self.base_url} index: {e}")
+                    self._index = set()
+            return self._index
+    
+    @staticmethod
+    def _conditional_headers(url: str, output_file: Path, meta_file: Path) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since from the sidecar, if it was saved for this URL"""
+        
+        if not (output_file.exists() and meta_file.exists()):
+            return {}
         
-        results = {}
+        try:
+            meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        if meta.get("url") != url:
+            return {}
+        
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+    
+    @staticmethod
+    def _save_validators(meta_file: Path, url: str, response: requests.Response) -> None:
+        """Record the response's ETag / Last-Modified next to the portrait"""
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            meta = {"url": url, "etag": etag, "last_modified": last_modified}
+            meta_file.write_text(json.dumps(meta, indent=2))
+        elif meta_file.exists():
+            meta_file.unlink()
+    
+    def download_all_portraits(self, max_workers: int = 4) -> Dict[str, bool]:
+        """
+        Download portraits for all SF3 characters
+        
+        Characters are fetched ``max_workers`` at a time. Each worker probes
+        its character's filename patterns one by one, so the server sees at
+        most ``max_workers`` requests in flight; throttled requests back off
+        in _request.
+        """
         
         print(f"🎨 Downloading portraits for {len(self.sf3_characters)} SF3 characters...")
         
-        for character_name in self.sf3_characters.keys():
-            print(f"\n📥 Downloading {character_name}...")
-            results[character_name] = self.download_character_portrait(character_name)
-            
-            # Be respectful to the server
-            time.sleep(1)
+        characters = list(self.sf3_characters)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            outcomes = pool.map(self.download_character_portrait, characters)
+            results = dict(zip(characters, outcomes))
         
         # Summary
         successful = sum(1 for success in results.values() if success)
@@ -216,7 +350,6 @@ def main():
     print("📥 Downloading priority characters...")
     for character in priority_characters:
         downloader.download_character_portrait(character)
-        time.sleep(1)
     
     # Ask user if they want to download all
     try:
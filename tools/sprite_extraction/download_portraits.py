@@ -50,9 +50,10 @@ except Exception as e:
     print(f"❌ Error: {e}")
     print("Creating basic placeholders instead...")
     
-    # Fallback: create basic placeholders
+    # Fallback: create basic placeholders. Only the font module is needed to
+    # draw and save a Surface; pygame.init() would also probe display/audio.
     import pygame
-    pygame.init()
+    pygame.font.init()
     
     output_dir = Path("tools/sprite_extraction/character_portraits")
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -79,7 +80,7 @@ except Exception as e:
             pygame.image.save(surface, str(portrait_file))
             print(f"✅ Created placeholder: {portrait_file}")
     
-    pygame.quit()
+    pygame.font.quit()
     print("🎯 Basic placeholders created!")
 
 print("\n🎮 Ready to test character selection with portraits!")
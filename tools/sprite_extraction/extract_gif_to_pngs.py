@@ -1,6 +1,7 @@
 """Extract GIF frames to PNG files."""
 
-from PIL import Image
+from PIL import Image, ImageSequence
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 gifs = {
@@ -12,29 +13,33 @@ gifs = {
 
 output_dir = '14_Akuma'
 
-for gif_file, start_sprite in gifs.items():
-    print(f"\nProcessing {gif_file}...")
 
-    img = Image.open(gif_file)
-    frame_count = 0
+def save_frame(frame, sprite_number):
+    """Write one decoded frame as <sprite_number>.png."""
+    output_path = os.path.join(output_dir, f"{sprite_number}.png")
+    frame.save(output_path, 'PNG')
+    return sprite_number
 
-    try:
-        while True:
-            # Save current frame
-            sprite_number = start_sprite + frame_count
-            output_path = os.path.join(output_dir, f"{sprite_number}.png")
 
-            # Convert to RGBA if needed
-            frame = img.convert('RGBA')
-            frame.save(output_path, 'PNG')
+def main():
+    # Frames are decoded in order here (GIF frames build on each other), then
+    # the PNG encodes -- the CPU-heavy part -- run one worker per core.
+    with ProcessPoolExecutor() as pool:
+        for gif_file, start_sprite in gifs.items():
+            print(f"\nProcessing {gif_file}...")
 
-            print(f"  Saved frame {frame_count} as {sprite_number}.png")
+            with Image.open(gif_file) as img:
+                # Convert to RGBA if needed
+                frames = [frame.convert('RGBA') for frame in ImageSequence.Iterator(img)]
 
-            # Move to next frame
-            frame_count += 1
-            img.seek(frame_count)
+            sprite_numbers = range(start_sprite, start_sprite + len(frames))
+            for frame_count, sprite_number in enumerate(pool.map(save_frame, frames, sprite_numbers)):
+                print(f"  Saved frame {frame_count} as {sprite_number}.png")
 
-    except EOFError:
-        print(f"  Extracted {frame_count} frames from {gif_file}")
+            print(f"  Extracted {len(frames)} frames from {gif_file}")
 
-print("\nDone!")
+    print("\nDone!")
+
+
+if __name__ == "__main__":
+    main()
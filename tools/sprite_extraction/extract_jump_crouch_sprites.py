@@ -2,7 +2,12 @@
 
 import requests
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+import hashlib
 import io
+import os
 
 # URLs for the animations
 urls = {
@@ -12,27 +17,60 @@ urls = {
     'crouching': 'https://www.justnopoint.com/zweifuss/colorswap.php?pcolorstring=AkumaPalette.bin&pcolornum=7&pname=akuma/akuma-crouching.gif'
 }
 
+# Downloaded GIFs are kept here, keyed by SHA-256 of the URL, so re-runs while
+# working on the sprite mapping read them from disk. Delete it to re-download.
+# Anchored to this script so the cache is the same wherever it is run from.
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+# Seconds to wait for the server to connect or send the next chunk.
+DOWNLOAD_TIMEOUT = 30
+
+
+def fetch_gif(session, url):
+    """(HTTP status, GIF bytes) for url, from CACHE_DIR when already downloaded.
+
+    A request that errors or times out comes back as (error message, None).
+    """
+    cache_path = CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.gif"
+    if cache_path.exists():
+        return 200, cache_path.read_bytes()
+
+    try:
+        response = session.get(url, timeout=DOWNLOAD_TIMEOUT)
+    except requests.RequestException as e:
+        return str(e), None
+    if response.status_code != 200:
+        return response.status_code, None
+
+    # Written under a temporary name and renamed, so an interrupted run never
+    # leaves a partial GIF that later runs would take as a cache hit.
+    CACHE_DIR.mkdir(exist_ok=True)
+    part_path = cache_path.with_name(cache_path.name + ".part")
+    part_path.write_bytes(response.content)
+    os.replace(part_path, cache_path)
+    return 200, response.content
+
+
 # Starting sprite numbers (continuing from existing sprite sheet)
 # We'll need to find what comes after the walk animations
 # Walk backward ended at 18310, so let's start at 18320
 sprite_mappings = {}
 current_sprite = 18320
 
-for anim_name, url in urls.items():
-    print(f"\nDownloading {anim_name}...")
-    response = requests.get(url)
+# The GIFs are independent, so fetch them all at once over one keep-alive
+# session; sprite numbers are still assigned in the order listed above.
+print(f"Downloading {len(urls)} animations...")
+with requests.Session() as session, ThreadPoolExecutor(max_workers=len(urls)) as pool:
+    downloads = dict(zip(urls, pool.map(partial(fetch_gif, session), urls.values())))
 
-    if response.status_code == 200:
-        img = Image.open(io.BytesIO(response.content))
+for anim_name, (status_code, content) in downloads.items():
+    print(f"\n{anim_name}:")
 
-        # Get number of frames
-        frame_count = 0
-        try:
-            while True:
-                img.seek(frame_count)
-                frame_count += 1
-        except EOFError:
-            pass
+    if status_code == 200:
+        # Get number of frames. n_frames walks the frame headers without
+        # compositing each frame the way seek() does (single-frame files lack it).
+        with Image.open(io.BytesIO(content)) as img:
+            frame_count = getattr(img, 'n_frames', 1)
 
         print(f"  Found {frame_count} frames")
 
@@ -48,7 +86,7 @@ for anim_name, url in urls.items():
         current_sprite += frame_count
 
     else:
-        print(f"  Failed to download: {response.status_code}")
+        print(f"  Failed to download: {status_code}")
 
 # Print the mapping
 print("\n" + "="*60)
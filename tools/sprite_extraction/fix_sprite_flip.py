@@ -1,6 +1,7 @@
 """Flip the extracted jump/crouch sprites to match the LEFT-facing default."""
 
 from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 # Sprite ranges to flip
@@ -13,28 +14,47 @@ sprite_ranges = [
 
 output_dir = '14_Akuma'
 
-total_flipped = 0
 
-for start, end in sprite_ranges:
-    print(f"\nFlipping sprites {start}-{end}...")
+def flip_sprite(sprite_num, sprite_path):
+    """Mirror one sprite in place; False if its file is missing."""
+    # Image.open reports a missing file itself, so no separate exists() stat.
+    try:
+        img = Image.open(sprite_path)
+    except FileNotFoundError:
+        print(f"  Warning: {sprite_path} not found")
+        return False
 
-    for sprite_num in range(start, end + 1):
-        sprite_path = os.path.join(output_dir, f"{sprite_num}.png")
+    with img:
+        # Flip horizontally
+        flipped = img.transpose(Image.FLIP_LEFT_RIGHT)
 
-        if os.path.exists(sprite_path):
-            # Load image
-            img = Image.open(sprite_path)
+    # Save back
+    flipped.save(sprite_path, 'PNG')
 
-            # Flip horizontally
-            flipped = img.transpose(Image.FLIP_LEFT_RIGHT)
+    if sprite_num % 10 == 0:
+        print(f"  Flipped {sprite_num}.png")
+    return True
 
-            # Save back
-            flipped.save(sprite_path, 'PNG')
-            total_flipped += 1
 
-            if sprite_num % 10 == 0:
-                print(f"  Flipped {sprite_num}.png")
-        else:
-            print(f"  Warning: {sprite_path} not found")
+def main():
+    total_flipped = 0
 
-print(f"\nTotal sprites flipped: {total_flipped}")
+    # Paths for every range are built once up front; workers only open,
+    # flip and rewrite.
+    range_paths = {
+        (start, end): [os.path.join(output_dir, f"{n}.png") for n in range(start, end + 1)]
+        for start, end in sprite_ranges
+    }
+
+    # Sprites are independent and the work is PNG decode/encode (CPU-bound in
+    # zlib), so each range is spread over one worker process per core.
+    with ProcessPoolExecutor() as pool:
+        for (start, end), paths in range_paths.items():
+            print(f"\nFlipping sprites {start}-{end}...")
+            total_flipped += sum(pool.map(flip_sprite, range(start, end + 1), paths))
+
+    print(f"\nTotal sprites flipped: {total_flipped}")
+
+
+if __name__ == "__main__":
+    main()
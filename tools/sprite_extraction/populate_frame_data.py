@@ -5,7 +5,8 @@ canonical SF3:3S frame data from fighting game resources.
 """
 
 import os
-import glob
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Canonical frame data for Akuma from SF3:3S (Arcade version)
 # Source: SuperCombo Wiki + EventHubs frame data
@@ -308,9 +309,17 @@ AKUMA_FRAME_DATA = {
 
 
 def count_png_frames(animation_dir):
-    """Count the number of PNG files in an animation directory."""
-    png_files = glob.glob(os.path.join(animation_dir, "frame_*.png"))
-    return len(png_files)
+    """Count the frame_*.png files in an animation directory."""
+    # One scandir pass; names are matched directly, with no glob pattern or list.
+    with os.scandir(animation_dir) as entries:
+        return sum(1 for e in entries
+                   if e.name.startswith("frame_") and e.name.endswith(".png"))
+
+
+@lru_cache(maxsize=None)
+def frame_file_list(frame_count):
+    """'frame_000.png, frame_001.png, ...' for frame_count frames (shared by equal counts)."""
+    return ', '.join(f'frame_{i:03d}.png' for i in range(frame_count))
 
 
 def update_description_file(animation_dir, animation_name):
@@ -352,7 +361,7 @@ Frame Data Source:
 
 Animation Files:
 - Total frames: {frame_count}
-- Files: {', '.join([f'frame_{i:03d}.png' for i in range(frame_count)])}
+- Files: {frame_file_list(frame_count)}
 
 Notes:
 - Animation frame count ({frame_count}) may differ from game frame data
@@ -360,9 +369,10 @@ Notes:
 - Startup + Active + Recovery = Total move duration in-game
 """
 
-    # Write the updated description
-    with open(description_path, 'w') as f:
-        f.write(content)
+    # Write the updated description: encoded once as UTF-8 and written as bytes,
+    # bypassing the text layer (and the locale's default encoding)
+    with open(description_path, 'wb') as f:
+        f.write(content.encode('utf-8'))
 
     print(f"  ✓ Updated {animation_name} (Key: {move_key}, Startup: {frame_data['startup']}f, Active: {frame_data['active']}f, Recovery: {frame_data['recovery']}f)")
     return True
@@ -387,17 +397,15 @@ def main():
 
     print(f"Found {len(animation_folders)} animation folders\n")
 
-    # Process each animation
-    updated_count = 0
-    skipped_count = 0
-
-    for animation_name in animation_folders:
-        animation_dir = os.path.join(animations_dir, animation_name)
+    # Process each animation. Folders are independent and the work is small
+    # file I/O (scandir + one write), which threads overlap without the
+    # start-up cost of worker processes.
+    animation_dirs = [os.path.join(animations_dir, name) for name in animation_folders]
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(update_description_file, animation_dirs, animation_folders))
 
-        if update_description_file(animation_dir, animation_name):
-            updated_count += 1
-        else:
-            skipped_count += 1
+    updated_count = sum(results)
+    skipped_count = len(results) - updated_count
 
     # Summary
     print(f"\n=== Summary ===")